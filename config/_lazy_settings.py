@@ -0,0 +1,76 @@
+"""
+Large settings dicts that are only built when something reads them.
+
+``config.settings`` exposes every name in ``LAZY_SETTINGS`` through a
+module-level ``__getattr__`` (PEP 562), so importing the settings module does
+not construct these literals up front.
+"""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any, Callable
+
+
+def _auth_password_validators() -> tuple[dict[str, str], ...]:
+    return (
+        {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
+        {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
+        {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
+        {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
+    )
+
+
+def _rest_framework() -> dict[str, Any]:
+    return {
+        'DEFAULT_AUTHENTICATION_CLASSES': ['rest_framework_simplejwt.authentication.JWTAuthentication'],
+        'DEFAULT_PERMISSION_CLASSES': ['rest_framework.permissions.AllowAny'],
+        'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+        'PAGE_SIZE': 10,
+    }
+
+
+def _simple_jwt() -> dict[str, Any]:
+    return {
+        'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
+        'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
+        'AUTH_HEADER_TYPES': ('Bearer',),
+    }
+
+
+def _jazzmin_settings() -> dict[str, Any]:
+    return {
+        'site_title': 'Administration',
+        'site_header': 'Administration',
+        'site_brand': 'Admin',
+        'welcome_sign': 'Welcome to Admin Panel',
+        'show_sidebar': True,
+        'navigation_expanded': False,
+    }
+
+
+def _ckeditor_configs() -> dict[str, Any]:
+    return {
+        "default": {
+            "toolbar": [
+                ["Bold", "Italic", "Underline"],
+                ["NumberedList", "BulletedList"],
+                ["Link", "Unlink"],
+                ["RemoveFormat"],
+            ],
+            "height": 200,
+            "width": "auto",
+        }
+    }
+
+
+LAZY_SETTINGS: dict[str, Callable[[], Any]] = {
+    'AUTH_PASSWORD_VALIDATORS': _auth_password_validators,
+    'REST_FRAMEWORK': _rest_framework,
+    'SIMPLE_JWT': _simple_jwt,
+    'JAZZMIN_SETTINGS': _jazzmin_settings,
+    'CKEDITOR_CONFIGS': _ckeditor_configs,
+}
+
+
+def load(name: str) -> Any:
+    return LAZY_SETTINGS[name]()
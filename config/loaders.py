@@ -0,0 +1,39 @@
+"""
+Process-wide one-shot loaders used by the settings module.
+
+``config.settings`` can be executed more than once per process (autoreload,
+test runners, several entry points), so anything expensive it does at import
+time lives here, where the ``lru_cache`` survives a settings re-import.
+"""
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+import dj_database_url
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def load_env(path: str) -> bool:
+    if os.path.isfile(path):
+        return load_dotenv(dotenv_path=path, override=False)
+    # Try to load from current directory as fallback
+    return load_dotenv(override=False)
+
+
+@lru_cache(maxsize=1)
+def get_db_config(url: str) -> dict:
+    return dj_database_url.parse(url, conn_max_age=600, ssl_require=True)
+
+
+@lru_cache(maxsize=1)
+def configure_cloudinary(cloud_name: str | None, api_key: str | None, api_secret: str | None) -> None:
+    # Deferred: uploader/api are pulled in by cloudinary_storage only when media is touched
+    import cloudinary
+
+    cloudinary.config(
+        cloud_name=cloud_name,
+        api_key=api_key,
+        api_secret=api_secret,
+    )
@@ -1,53 +1,56 @@
 from __future__ import annotations
 
+import logging
 import os
-from pathlib import Path
+from urllib.parse import urlparse
 from django.core.exceptions import ImproperlyConfigured
 
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
-import dj_database_url
-from dotenv import load_dotenv
+from config import _lazy_settings
+from config.loaders import configure_cloudinary, get_db_config, load_env
 
-# Load .env file - explicitly from project root
-BASE_DIR = Path(__file__).resolve().parent.parent
-env_path = BASE_DIR / '.env'
+logger = logging.getLogger('config.settings')
 
-if env_path.exists():
-    load_dotenv(dotenv_path=env_path)
-else:
-    # Try to load from current directory as fallback
-    load_dotenv()
 
-# SECURITY
-SECRET_KEY: str = os.environ.get('DJANGO_SECRET_KEY')
-if not SECRET_KEY:
-    raise ImproperlyConfigured('DJANGO_SECRET_KEY is not set in environment variables')
+def _redact(url: str) -> str:
+    # Logs mein sirf scheme/host/db - user/password kabhi nahi
+    parts = urlparse(url)
+    port = f':{parts.port}' if parts.port else ''
+    return f"{parts.scheme}://***@{parts.hostname}{port}/{parts.path.lstrip('/')}"
 
-DEBUG: bool = os.environ.get('DJANGO_DEBUG', 'False') == 'True'
 
-# ALLOWED_HOSTS - Railway ke liye update karo
-ALLOWED_HOSTS: list[str] = []
+# Load .env file - explicitly from project root
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+env_path = os.path.join(BASE_DIR, '.env')
+load_env(env_path)
+logger.debug('Loaded environment, .env path: %s', env_path)
 
-# Environment se ALLOWED_HOSTS lelo
-env_hosts = os.environ.get('DJANGO_ALLOWED_HOSTS', '')
-if env_hosts:
-    ALLOWED_HOSTS.extend(env_hosts.split(','))
+# Snapshot after .env is loaded - plain dict lookups instead of os.environ proxy
+_env = dict(os.environ)
 
-# Railway domains automatically add karo
-ALLOWED_HOSTS.extend([
-    '.railway.app',  # Sab railway subdomains allow karega
-    'localhost',
-    '127.0.0.1',
-    '[::1]',
-])
+# SECURITY
+SECRET_KEY: str = _env.get('DJANGO_SECRET_KEY')
+if not SECRET_KEY:
+    raise ImproperlyConfigured('DJANGO_SECRET_KEY is not set in environment variables')
 
-# Remove any empty strings
-ALLOWED_HOSTS = [host.strip() for host in ALLOWED_HOSTS if host.strip()]
+# Boolean env values - 'true', 'True', '1', 'yes', 'on' sab chalega
+_true_values = frozenset({'1', 'true', 'yes', 'on'})
+
+DEBUG: bool = _env.get('DJANGO_DEBUG', '').strip().lower() in _true_values
+
+# ALLOWED_HOSTS - Environment se lelo, Railway domains automatically add karo
+ALLOWED_HOSTS: tuple[str, ...] = tuple(
+    host for host in map(str.strip, (
+        *_env.get('DJANGO_ALLOWED_HOSTS', '').split(','),
+        '.railway.app',  # Sab railway subdomains allow karega
+        'localhost',
+        '127.0.0.1',
+        '[::1]',
+    ))
+    if host
+)
 
 # DATABASE - Railway PostgreSQL ONLY
-DATABASE_URL: str = os.environ.get('DATABASE_URL')
+DATABASE_URL: str = _env.get('DATABASE_URL')
 
 if not DATABASE_URL:
     raise ImproperlyConfigured(
@@ -58,28 +61,27 @@ if not DATABASE_URL:
 
 # Parse DATABASE_URL
 try:
-    db_config = dj_database_url.parse(DATABASE_URL, conn_max_age=600, ssl_require=True)
-    
-    # Verify it's PostgreSQL
-    engine = db_config.get('ENGINE', '')
-    if 'postgresql' not in engine and 'postgres' not in engine:
-        raise ImproperlyConfigured(
-            f'Database ENGINE should be PostgreSQL, but got: {engine}\n'
-            f'Please use a PostgreSQL database from Railway.'
-        )
-    
-    DATABASES = {
-        'default': db_config
-    }
-    
-except Exception as e:
+    # Copy: Django fills in connection defaults on the dict it is given
+    db_config = dict(get_db_config(DATABASE_URL))
+except (ValueError, KeyError) as e:
+    raise ImproperlyConfigured(f'Failed to parse DATABASE_URL: {e}') from e
+
+# Verify it's PostgreSQL
+engine = db_config.get('ENGINE', '')
+if 'postgresql' not in engine and 'postgres' not in engine:
     raise ImproperlyConfigured(
-        f'Failed to parse DATABASE_URL: {str(e)}\n'
-        f'DATABASE_URL value: {DATABASE_URL[:100]}...'
+        f'Database ENGINE should be PostgreSQL, but got: {engine}\n'
+        f'Please use a PostgreSQL database from Railway.'
     )
 
+DATABASES = {
+    'default': db_config
+}
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug('Database configured: %s, DATABASE_URL=%s', engine, _redact(DATABASE_URL))
+
 # APPLICATIONS
-INSTALLED_APPS = [
+INSTALLED_APPS = (
     'jazzmin',
     'django.contrib.admin',
     'django.contrib.auth',
@@ -98,9 +100,9 @@ INSTALLED_APPS = [
     'cloudinary_storage',
 
     'product',
-]
+)
 
-MIDDLEWARE = [
+MIDDLEWARE = (
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -110,14 +112,14 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-]
+)
 
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [BASE_DIR / 'templates'],
+        'DIRS': [os.path.join(BASE_DIR, 'templates')],
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
@@ -132,104 +134,108 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
-# PASSWORD VALIDATORS
-AUTH_PASSWORD_VALIDATORS = [
-    {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
-    {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
-    {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
-    {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
-]
+# PASSWORD VALIDATORS, REST FRAMEWORK, JWT, JAZZMIN, CKEditor configs
+# config/_lazy_settings.py mein hain (neeche module __getattr__ dekho).
+# Note: django.setup() dir() ke har uppercase naam par getattr karta hai, is liye
+# Django ke andar ye startup par hi ban jati hain - deferral sirf un readers ke
+# liye hai jo Django setup kiye baghair config.settings direct import karte hain.
 
 # INTERNATIONALIZATION
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'Asia/Karachi'
 USE_I18N = True
-USE_L10N = True
 USE_TZ = True
 
 # STATIC FILES
 STATIC_URL = '/static/'
-STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_DIRS = [BASE_DIR / 'static']
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+STATICFILES_DIRS = (os.path.join(BASE_DIR, 'static'),)
+
+# WhiteNoise - production mein sirf collectstatic wali files, har request par stat() nahi
+WHITENOISE_AUTOREFRESH = DEBUG
+WHITENOISE_USE_FINDERS = DEBUG
 
 # MEDIA / CLOUDINARY
 MEDIA_URL = '/media/'
-DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
 
 # Cloudinary Configuration
-CLOUD_NAME = os.environ.get('CLOUD_NAME')
-API_KEY = os.environ.get('API_KEY')
-API_SECRET = os.environ.get('API_SECRET')
+CLOUD_NAME = _env.get('CLOUD_NAME')
+API_KEY = _env.get('API_KEY')
+API_SECRET = _env.get('API_SECRET')
+cloudinary_enabled = bool(CLOUD_NAME and API_KEY and API_SECRET)
+
+if cloudinary_enabled:
+    configure_cloudinary(CLOUD_NAME, API_KEY, API_SECRET)
+    # MediaCloudinaryStorage apne credentials yahan se (ya CLOUDINARY_* env) leta hai
+    CLOUDINARY_STORAGE = {
+        'CLOUD_NAME': CLOUD_NAME,
+        'API_KEY': API_KEY,
+        'API_SECRET': API_SECRET,
+    }
+else:
+    # Local dev without Cloudinary - singleton initialise hi mat karo, media local disk par
+    logger.info('Cloudinary credentials not fully set; using FileSystemStorage for media')
+
+# STORAGES - Django 5.1+ mein STATICFILES_STORAGE / DEFAULT_FILE_STORAGE khatam
+STORAGES = {
+    'default': {
+        'BACKEND': (
+            'cloudinary_storage.storage.MediaCloudinaryStorage' if cloudinary_enabled
+            else 'django.core.files.storage.FileSystemStorage'
+        ),
+    },
+    # Production: hash + gzip/brotli once at collectstatic, WhiteNoise serves the
+    # precompressed files as-is. Dev: plain storage, no hashing/compression work.
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+            else 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+        ),
+    },
+}
 
-if not all([CLOUD_NAME, API_KEY, API_SECRET]):
-    pass  # Silent fail for production
+# CKEditor
+CKEDITOR_UPLOAD_PATH = "ckeditor_uploads/"
 
-cloudinary.config(
-    cloud_name=CLOUD_NAME,
-    api_key=API_KEY,
-    api_secret=API_SECRET,
+# CORS
+CORS_ALLOWED_ORIGINS = tuple(
+    origin for origin in map(str.strip, _env.get('CORS_ALLOWED_ORIGINS', 'http://localhost:5173').split(','))
+    if origin
 )
+CORS_ALLOW_CREDENTIALS = True
 
-# REST FRAMEWORK
-REST_FRAMEWORK = {
-    'DEFAULT_AUTHENTICATION_CLASSES': ['rest_framework_simplejwt.authentication.JWTAuthentication'],
-    'DEFAULT_PERMISSION_CLASSES': ['rest_framework.permissions.AllowAny'],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 10,
-}
+# CSRF TRUSTED ORIGINS
+railway_domain = _env.get('RAILWAY_PUBLIC_DOMAIN')
+CSRF_TRUSTED_ORIGINS = tuple(
+    origin for origin in (
+        f'https://{railway_domain}' if railway_domain else '',
+        'https://*.railway.app',
+        'http://localhost:5173',
+        'http://localhost:8000',
+        'http://127.0.0.1:8000',
+    )
+    if origin
+)
 
-# JWT
-from datetime import timedelta
-SIMPLE_JWT = {
-    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
-    'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
-    'AUTH_HEADER_TYPES': ('Bearer',),
-}
+# SECURE PROXY SETTINGS (for Railway) - sirf production mein
+IS_PROD: bool = not DEBUG
+if IS_PROD:
+    SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+    SECURE_SSL_REDIRECT = SESSION_COOKIE_SECURE = CSRF_COOKIE_SECURE = True
 
-# JAZZMIN
-JAZZMIN_SETTINGS = {
-    'site_title': 'Administration',
-    'site_header': 'Administration',
-    'site_brand': 'Admin',
-    'welcome_sign': 'Welcome to Admin Panel',
-    'show_sidebar': True,
-    'navigation_expanded': False,
-}
 
-# CKEditor
-CKEDITOR_UPLOAD_PATH = "ckeditor_uploads/"
+_lazy_cache: dict = {}
 
-CKEDITOR_CONFIGS = {
-    "default": {
-        "toolbar": [
-            ["Bold", "Italic", "Underline"],
-            ["NumberedList", "BulletedList"],
-            ["Link", "Unlink"],
-            ["RemoveFormat"],
-        ],
-        "height": 200,
-        "width": "auto",
-    }
-}
 
-# CORS
-CORS_ALLOWED_ORIGINS = os.environ.get('CORS_ALLOWED_ORIGINS', 'http://localhost:5173').split(',')
-CORS_ALLOW_CREDENTIALS = True
+def __getattr__(name: str):
+    # PEP 562: builder ek dafa chalta hai, phir cache (django.setup() sab names read karta hai)
+    if name in _lazy_settings.LAZY_SETTINGS:
+        if name not in _lazy_cache:
+            _lazy_cache[name] = _lazy_settings.load(name)
+        return _lazy_cache[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-# CSRF TRUSTED ORIGINS
-CSRF_TRUSTED_ORIGINS = []
-if os.environ.get('RAILWAY_PUBLIC_DOMAIN'):
-    CSRF_TRUSTED_ORIGINS.append(f"https://{os.environ.get('RAILWAY_PUBLIC_DOMAIN')}")
-CSRF_TRUSTED_ORIGINS.extend([
-    'https://*.railway.app',
-    'http://localhost:5173',
-    'http://localhost:8000',
-    'http://127.0.0.1:8000',
-])
-
-# SECURE PROXY SETTINGS (for Railway)
-SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
-SECURE_SSL_REDIRECT = not DEBUG
-SESSION_COOKIE_SECURE = not DEBUG
-CSRF_COOKIE_SECURE = not DEBUG
\ No newline at end of file
+
+def __dir__() -> list[str]:
+    # Django's Settings() discovers setting names via dir(module)
+    return [*globals(), *_lazy_settings.LAZY_SETTINGS]